@@ -4,13 +4,19 @@ from __future__ import annotations
 import math
 import random
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import pygame
 
 Vec2 = Tuple[int, int]
 
+# Each cached gradient strip is a full-width, double-height surface, so only
+# the most recently used few (theme, window size) pairs are kept.
+BACKGROUND_CACHE_SIZE = 4
+
 
 @dataclass
 class Settings:
@@ -91,41 +97,94 @@ THEMES: Sequence[Theme] = (
 )
 
 
-def lerp(a: float, b: float, t: float) -> float:
-    return a + (b - a) * t
-
-
-def lerp_color(c1: Tuple[int, int, int], c2: Tuple[int, int, int], t: float) -> Tuple[int, int, int]:
-    return (
-        int(lerp(c1[0], c2[0], t)),
-        int(lerp(c1[1], c2[1], t)),
-        int(lerp(c1[2], c2[2], t)),
-    )
+def lerp_colors(c1: Tuple[int, int, int], c2: Tuple[int, int, int], t: np.ndarray) -> np.ndarray:
+    """Interpolate between two colours at every ``t`` at once, returning an ``(N, 3)`` uint8 array."""
+    start = np.array(c1, dtype=np.float64)
+    end = np.array(c2, dtype=np.float64)
+    return (start + (end - start) * t[:, None]).astype(np.uint8)
 
 
 def generate_tone(frequency: float, duration_ms: int, volume: float = 0.5) -> pygame.mixer.Sound:
-    sample_rate = 44100
+    sample_rate, _, channels = pygame.mixer.get_init()
     n_samples = int(sample_rate * duration_ms / 1000)
     amplitude = int(32767 * volume)
-    buffer = bytearray()
-    for i in range(n_samples):
-        t = i / sample_rate
-        sample = int(amplitude * math.sin(2 * math.pi * frequency * t))
-        buffer += sample.to_bytes(2, byteorder="little", signed=True)
-    return pygame.mixer.Sound(buffer=bytes(buffer))
+    t = np.arange(n_samples, dtype=np.float32) / sample_rate
+    wave = (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+    if channels > 1:
+        wave = np.repeat(wave[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(wave)
+
+
+def display_refresh_rate(default: int = 60) -> int:
+    # Only pygame-ce exposes the refresh rate; classic pygame falls back to the default.
+    get_rate = getattr(pygame.display, "get_current_refresh_rate", None)
+    if get_rate is None:
+        return default
+    try:
+        return get_rate() or default
+    except pygame.error:
+        return default
 
 
 class Snake:
     def __init__(self, grid_width: int, grid_height: int):
         start_x = grid_width // 2
         start_y = grid_height // 2
-        self.segments: List[Vec2] = [(start_x, start_y + i) for i in range(3)]
-        self.last_positions: List[Vec2] = list(self.segments)
+        # Segments live in _xy[_start:_end] ordered tail to head, so moving
+        # appends the head at the end and drops the tail by advancing _start.
+        self._xy = np.empty((64, 2), dtype=np.int16)
+        self._start = 0
+        self._end = 0
+        for i in reversed(range(3)):
+            self._push_head((start_x, start_y + i))
+        self.has_moved = False
+        self.last_tail: Optional[Vec2] = None
+        self.occupied: Set[Vec2] = set(self.segments)
+        self.self_collision = False
         self.direction: Vec2 = (0, -1)
         self.pending_direction: Vec2 = (0, -1)
         self.grid_width = grid_width
         self.grid_height = grid_height
         self.grow_segments = 0
+        self._color_cache_key: Optional[Tuple] = None
+        self._color_cache: List[Tuple[int, int, int]] = []
+
+    @property
+    def length(self) -> int:
+        return self._end - self._start
+
+    @property
+    def head(self) -> Vec2:
+        x, y = self._xy[self._end - 1].tolist()
+        return (x, y)
+
+    @property
+    def seg_xy(self) -> np.ndarray:
+        """Segment cells as a ``(length, 2)`` view ordered head first."""
+        return self._xy[self._start:self._end][::-1]
+
+    @property
+    def segments(self) -> List[Vec2]:
+        return [(x, y) for x, y in self.seg_xy.tolist()]
+
+    def _push_head(self, cell: Vec2) -> None:
+        if self._end == len(self._xy):
+            live = self.length
+            if live * 2 > len(self._xy):
+                grown = np.empty((len(self._xy) * 2, 2), dtype=np.int16)
+                grown[:live] = self._xy[self._start:self._end]
+                self._xy = grown
+            else:
+                self._xy[:live] = self._xy[self._start:self._end]
+            self._start = 0
+            self._end = live
+        self._xy[self._end] = cell
+        self._end += 1
+
+    def _pop_tail(self) -> Vec2:
+        x, y = self._xy[self._start].tolist()
+        self._start += 1
+        return (x, y)
 
     def set_direction(self, direction: Vec2) -> None:
         if direction == self.direction:
@@ -136,27 +195,50 @@ class Snake:
 
     def move(self) -> None:
         self.direction = self.pending_direction
-        head_x, head_y = self.segments[0]
+        head_x, head_y = self.head
         dx, dy = self.direction
         new_head = (head_x + dx, head_y + dy)
-        self.last_positions = list(self.segments)
-        self.segments.insert(0, new_head)
+        self.has_moved = True
+        self._push_head(new_head)
         if self.grow_segments > 0:
             self.grow_segments -= 1
+            self.last_tail = None
         else:
-            self.segments.pop()
+            self.last_tail = self._pop_tail()
+            self.occupied.discard(self.last_tail)
+        self.self_collision = new_head in self.occupied
+        self.occupied.add(new_head)
 
     def collided(self) -> bool:
-        head = self.segments[0]
+        head = self.head
         if not (0 <= head[0] < self.grid_width and 0 <= head[1] < self.grid_height):
             return True
-        if head in self.segments[1:]:
-            return True
-        return False
+        return self.self_collision
 
     def grow(self) -> None:
         self.grow_segments += 1
 
+    def previous_xy(self) -> np.ndarray:
+        """Return the cell each segment occupied before the last move, head first."""
+        current = self.seg_xy
+        if not self.has_moved:
+            return current
+        # Every body segment steps into the cell of the segment ahead of it.
+        previous = np.empty_like(current)
+        previous[:-1] = current[1:]
+        previous[-1] = self.last_tail if self.last_tail is not None else current[-1]
+        return previous
+
+    def segment_colors(self, body: Tuple[int, int, int], head: Tuple[int, int, int]) -> List[Tuple[int, int, int]]:
+        count = self.length
+        key = (count, body, head)
+        if key != self._color_cache_key:
+            colors = lerp_colors(body, head, np.arange(count) / max(1, count - 1))
+            self._color_cache = [tuple(color) for color in colors.tolist()]
+            self._color_cache[0] = head
+            self._color_cache_key = key
+        return self._color_cache
+
 
 class Food:
     def __init__(self, grid_width: int, grid_height: int):
@@ -164,7 +246,13 @@ class Food:
         self.grid_height = grid_height
         self.position: Vec2 = (0, 0)
 
-    def reposition(self, occupied: Sequence[Vec2]) -> None:
+    def reposition(self, occupied: AbstractSet[Vec2]) -> None:
+        free_count = self.grid_width * self.grid_height - len(occupied)
+        for _ in range(2 * max(0, free_count)):
+            cell = (random.randrange(self.grid_width), random.randrange(self.grid_height))
+            if cell not in occupied:
+                self.position = cell
+                return
         free_cells = [
             (x, y)
             for x in range(self.grid_width)
@@ -179,6 +267,7 @@ class Food:
 
 class SnakeGameApp:
     def __init__(self) -> None:
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=1)
         pygame.init()
         pygame.font.init()
         try:
@@ -192,13 +281,23 @@ class SnakeGameApp:
         self.window = pygame.display.set_mode(self.settings.window_size, pygame.RESIZABLE)
         pygame.display.set_caption("Aurora Snake")
         self.clock = pygame.time.Clock()
+        self._target_fps = min(display_refresh_rate(), 120)
+        self._pending_resize: Optional[Tuple[int, int]] = None
+        self._overlay: Optional[pygame.Surface] = None
 
         self.font_large = pygame.font.SysFont("Segoe UI", 96, bold=True)
         self.font_medium = pygame.font.SysFont("Segoe UI", 48, bold=True)
         self.font_small = pygame.font.SysFont("Segoe UI", 28)
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._title_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
 
         self.state: str = "menu"
+        self._idle_states = {"gameover"}
         self.wave_offset = 0.0
+        self._bg_cache: OrderedDict[Tuple[str, int, int], pygame.Surface] = OrderedDict()
+        self._sprite_cache: Dict[Tuple, pygame.Surface] = {}
+        self._grid_surface: Optional[pygame.Surface] = None
+        self._grid_key: Optional[Tuple[str, int, int, int]] = None
 
         self.snake: Optional[Snake] = None
         self.food: Optional[Food] = None
@@ -234,6 +333,30 @@ class SnakeGameApp:
         if sound is not None:
             sound.play()
 
+    # ------------------------------------------------------------------
+    # Window helpers
+    # ------------------------------------------------------------------
+
+    def request_resize(self, size: Tuple[int, int]) -> None:
+        # Only the last request of a frame is applied, in draw().
+        self._pending_resize = size
+
+    def _apply_pending_resize(self) -> None:
+        if self._pending_resize is None:
+            return
+        width, height = self._pending_resize
+        self._pending_resize = None
+        current_width, current_height = self.window.get_size()
+        if abs(width - current_width) > 1 or abs(height - current_height) > 1:
+            self.window = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+            self._overlay = None
+
+    def _overlay_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        # One full-window SRCALPHA scratch surface, reused by every overlay pass.
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        return self._overlay
+
     # ------------------------------------------------------------------
     # State transitions
     # ------------------------------------------------------------------
@@ -241,10 +364,11 @@ class SnakeGameApp:
     def start_game(self) -> None:
         self.settings.clamp()
         self.theme = THEMES[self.settings.theme_index % len(THEMES)]
-        self.window = pygame.display.set_mode(self.settings.window_size, pygame.RESIZABLE)
+        self.request_resize(self.settings.window_size)
+        self._sprite_cache.clear()
         self.snake = Snake(self.settings.grid_width, self.settings.grid_height)
         self.food = Food(self.settings.grid_width, self.settings.grid_height)
-        self.food.reposition(self.snake.segments)
+        self.food.reposition(self.snake.occupied)
         self.score = 0
         self.move_timer = 0.0
         self.move_progress = 0.0
@@ -272,7 +396,7 @@ class SnakeGameApp:
             if event.type == pygame.QUIT:
                 return False
             if event.type == pygame.VIDEORESIZE:
-                self.window = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                self.request_resize(event.size)
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 if self.state == "playing":
                     self.show_menu()
@@ -330,7 +454,7 @@ class SnakeGameApp:
         if theme_changed:
             self.theme = THEMES[self.settings.theme_index % len(THEMES)]
         if self.settings.window_size != previous_size:
-            self.window = pygame.display.set_mode(self.settings.window_size, pygame.RESIZABLE)
+            self.request_resize(self.settings.window_size)
 
     def handle_playing_events(self, events: Sequence[pygame.event.Event]) -> None:
         if not self.snake:
@@ -376,10 +500,10 @@ class SnakeGameApp:
                 self.play_sound("bump")
                 self.show_game_over()
                 return
-            if self.snake.segments[0] == self.food.position:
+            if self.snake.head == self.food.position:
                 self.score += 10
                 self.snake.grow()
-                self.food.reposition(self.snake.segments)
+                self.food.reposition(self.snake.occupied)
                 self.play_sound("eat")
         if moved:
             self.move_progress = 0.0
@@ -391,6 +515,7 @@ class SnakeGameApp:
     # ------------------------------------------------------------------
 
     def draw(self) -> None:
+        self._apply_pending_resize()
         self.draw_background(self.window)
         if self.state == "menu":
             self.draw_menu()
@@ -402,42 +527,91 @@ class SnakeGameApp:
             self.draw_playing()
             self.draw_game_over()
         if self.transition_alpha > 0:
-            overlay = pygame.Surface(self.window.get_size(), pygame.SRCALPHA)
+            overlay = self._overlay_surface(self.window.get_size())
             overlay.fill((0, 0, 0, int(self.transition_alpha)))
             self.window.blit(overlay, (0, 0))
         pygame.display.flip()
 
+    def _gradient_strip(self, width: int, height: int) -> pygame.Surface:
+        """Return a cached ``width x 2*height`` strip holding two stacked gradient periods."""
+        theme = self.theme
+        key = (theme.name, width, height)
+        strip = self._bg_cache.get(key)
+        if strip is not None:
+            self._bg_cache.move_to_end(key)
+        else:
+            t = (np.arange(height * 2) / max(1, height - 1)) % 1.0
+            colors = lerp_colors(theme.background_top, theme.background_bottom, t)
+            strip = pygame.Surface((width, height * 2))
+            pixels = pygame.surfarray.pixels3d(strip)
+            pixels[:] = colors[None, :, :]
+            del pixels
+            strip = strip.convert()
+            self._bg_cache[key] = strip
+            while len(self._bg_cache) > BACKGROUND_CACHE_SIZE:
+                self._bg_cache.popitem(last=False)
+        return strip
+
     def draw_background(self, surface: pygame.Surface) -> None:
         width, height = surface.get_size()
         theme = self.theme
         phase = (self.wave_offset % (2 * math.pi)) / (2 * math.pi)
-        for y in range(height):
-            t = y / max(1, height - 1)
-            color = lerp_color(theme.background_top, theme.background_bottom, (t + phase) % 1.0)
-            pygame.draw.line(surface, color, (0, y), (width, y))
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-        for i in range(6):
-            phase = self.wave_offset + i * 0.8
-            amplitude = height * 0.06 * (1 + i * 0.1)
-            color = (*theme.accent, 28)
-            points = []
-            for x in range(0, width + 40, 40):
-                y = height / 2 + math.sin(phase + x / 220) * amplitude
-                points.append((x, y))
-            if len(points) >= 2:
-                pygame.draw.lines(overlay, color, False, points, 4)
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._gradient_strip(width, height), (0, -int(phase * (height - 1))))
+        xs = np.arange(0, width + 40, 40)
+        waves = np.arange(6)
+        phases = self.wave_offset + waves * 0.8
+        amplitudes = height * 0.06 * (1 + waves * 0.1)
+        ys = height / 2 + np.sin(phases[:, None] + xs / 220) * amplitudes[:, None]
+        # The waves never leave a horizontal band around the middle, so only
+        # that band of the overlay is cleared and alpha-blended.
+        reach = int(amplitudes[-1]) + 4
+        band = pygame.Rect(0, height // 2 - reach, width, reach * 2).clip(surface.get_rect())
+        overlay = self._overlay_surface((width, height))
+        overlay.fill((0, 0, 0, 0), band)
+        color = (*theme.accent, 28)
+        overlay.lock()
+        for row in ys:
+            pygame.draw.lines(overlay, color, False, np.column_stack((xs, row)).tolist(), 4)
+        overlay.unlock()
+        surface.blit(overlay, band.topleft, band)
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (font, text, color)
+        rendered = self._text_cache.get(key)
+        if rendered is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            rendered = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = rendered
+        return rendered
+
+    def _title_surface(self, text: str) -> pygame.Surface:
+        accent = self.theme.accent
+        key = (text, accent)
+        composite = self._title_cache.get(key)
+        if composite is None:
+            base = self._render_text(self.font_large, text, accent)
+            layers = []
+            for i in range(5, 0, -1):
+                glow = pygame.transform.rotozoom(base, 0, 1 + i * 0.05)
+                glow.set_alpha(int(36 * i))
+                layers.append(glow)
+            layers.append(base)
+            width, height = layers[0].get_size()
+            composite = pygame.Surface((width, height), pygame.SRCALPHA)
+            # Every layer shares the accent colour, so seeding the transparent
+            # pixels with it keeps the stacked blend identical to drawing live.
+            composite.fill((*accent, 0))
+            for layer in layers:
+                layer_width, layer_height = layer.get_size()
+                composite.blit(layer, (width // 2 - layer_width // 2, height // 2 - layer_height // 2))
+            composite = composite.convert_alpha()
+            self._title_cache[key] = composite
+        return composite
 
     def draw_title(self, surface: pygame.Surface, text: str, center_y: int) -> None:
-        theme = self.theme
-        base = self.font_large.render(text, True, theme.accent)
-        rect = base.get_rect(center=(surface.get_width() // 2, center_y))
-        for i in range(5, 0, -1):
-            glow = pygame.transform.rotozoom(base, 0, 1 + i * 0.05)
-            glow.set_alpha(int(36 * i))
-            glow_rect = glow.get_rect(center=rect.center)
-            surface.blit(glow, glow_rect)
-        surface.blit(base, rect)
+        title = self._title_surface(text)
+        surface.blit(title, title.get_rect(center=(surface.get_width() // 2, center_y)))
 
     def draw_menu(self) -> None:
         surface = self.window
@@ -448,7 +622,7 @@ class SnakeGameApp:
             "ESC pauses back to this menu",
         ]
         for i, text in enumerate(instructions):
-            info = self.font_small.render(text, True, (240, 244, 255))
+            info = self._render_text(self.font_small, text, (240, 244, 255))
             rect = info.get_rect(center=(surface.get_width() // 2, 260 + i * 32))
             surface.blit(info, rect)
 
@@ -458,16 +632,21 @@ class SnakeGameApp:
             ("Quit", lambda: sys.exit(0)),
         ]
         self.menu_buttons = []
+        mouse_pos = pygame.mouse.get_pos()
+        # Buttons never overlap, so all shapes are drawn under one lock
+        # before any label is blitted.
+        surface.lock()
         for i, (label, action) in enumerate(options):
             rect = pygame.Rect(0, 0, 320, 68)
             rect.center = (surface.get_width() // 2, 360 + i * 90)
             self.menu_buttons.append((label, rect, action))
-            is_hovered = rect.collidepoint(pygame.mouse.get_pos())
             color = self.theme.accent
-            if is_hovered:
+            if rect.collidepoint(mouse_pos):
                 color = tuple(min(255, int(c * 1.18)) for c in color)
             pygame.draw.rect(surface, color, rect, border_radius=28)
-            text_surf = self.font_medium.render(label, True, (25, 25, 25))
+        surface.unlock()
+        for label, rect, _ in self.menu_buttons:
+            text_surf = self._render_text(self.font_medium, label, (25, 25, 25))
             text_rect = text_surf.get_rect(center=rect.center)
             surface.blit(text_surf, text_rect)
 
@@ -483,15 +662,15 @@ class SnakeGameApp:
         ]
         for i, (label, value, hint) in enumerate(options):
             text = f"{label}: {value}"
-            value_surface = self.font_medium.render(text, True, (245, 245, 248))
+            value_surface = self._render_text(self.font_medium, text, (245, 245, 248))
             rect = value_surface.get_rect(center=(surface.get_width() // 2, 250 + i * 70))
             surface.blit(value_surface, rect)
-            hint_surface = self.font_small.render(f"[{hint}]", True, (220, 220, 230))
+            hint_surface = self._render_text(self.font_small, f"[{hint}]", (220, 220, 230))
             hint_rect = hint_surface.get_rect(midleft=(rect.right + 20, rect.centery))
             surface.blit(hint_surface, hint_rect)
 
         prompt = "Press ENTER to start, ESC to return"
-        prompt_surface = self.font_small.render(prompt, True, (235, 235, 240))
+        prompt_surface = self._render_text(self.font_small, prompt, (235, 235, 240))
         prompt_rect = prompt_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() - 120))
         surface.blit(prompt_surface, prompt_rect)
 
@@ -501,44 +680,57 @@ class SnakeGameApp:
         grid_h = self.settings.grid_height
         offset_x = (surface.get_width() - grid_w * cell) // 2
         offset_y = (surface.get_height() - grid_h * cell) // 2
-        line_color = tuple(max(0, c - 60) for c in self.theme.background_bottom)
-        for x in range(grid_w + 1):
-            px = offset_x + x * cell
-            pygame.draw.line(surface, line_color, (px, offset_y), (px, offset_y + grid_h * cell), 1)
-        for y in range(grid_h + 1):
-            py = offset_y + y * cell
-            pygame.draw.line(surface, line_color, (offset_x, py), (offset_x + grid_w * cell, py), 1)
+        key = (self.theme.name, cell, grid_w, grid_h)
+        if self._grid_surface is None or self._grid_key != key:
+            line_color = tuple(max(0, c - 60) for c in self.theme.background_bottom)
+            grid = pygame.Surface((grid_w * cell + 1, grid_h * cell + 1), pygame.SRCALPHA)
+            for x in range(grid_w + 1):
+                pygame.draw.line(grid, line_color, (x * cell, 0), (x * cell, grid_h * cell), 1)
+            for y in range(grid_h + 1):
+                pygame.draw.line(grid, line_color, (0, y * cell), (grid_w * cell, y * cell), 1)
+            self._grid_surface = grid.convert_alpha()
+            self._grid_key = key
+        surface.blit(self._grid_surface, (offset_x, offset_y))
+
+    def _rounded_sprite(self, color: Tuple[int, int, int], size: Tuple[int, int], radius: int) -> pygame.Surface:
+        key = ("rect", color, size, radius)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(sprite, color, sprite.get_rect(), border_radius=radius)
+            sprite = sprite.convert_alpha()
+            self._sprite_cache[key] = sprite
+        return sprite
+
+    def _glow_sprite(self, color: Tuple[int, int, int, int], diameter: int) -> pygame.Surface:
+        key = ("glow", color, diameter)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (diameter // 2, diameter // 2), diameter // 2)
+            sprite = sprite.convert_alpha()
+            self._sprite_cache[key] = sprite
+        return sprite
 
     def draw_snake(self, surface: pygame.Surface) -> None:
         assert self.snake
         cell = self.settings.cell_size
         offset_x = (surface.get_width() - self.settings.grid_width * cell) // 2
         offset_y = (surface.get_height() - self.settings.grid_height * cell) // 2
-        for index, segment in enumerate(self.snake.segments):
-            prev = self.snake.last_positions[index] if index < len(self.snake.last_positions) else segment
-            x = lerp(prev[0], segment[0], self.move_progress)
-            y = lerp(prev[1], segment[1], self.move_progress)
-            rect = pygame.Rect(
-                offset_x + x * cell,
-                offset_y + y * cell,
-                cell,
-                cell,
-            )
-            rect.inflate_ip(-cell * 0.25, -cell * 0.25)
-            base_color = lerp_color(self.theme.snake_body, self.theme.snake_head, index / max(1, len(self.snake.segments) - 1))
-            if index == 0:
-                base_color = self.theme.snake_head
-            pygame.draw.rect(surface, base_color, rect, border_radius=12)
-        head = self.snake.segments[0]
-        glow_rect = pygame.Rect(
-            offset_x + head[0] * cell,
-            offset_y + head[1] * cell,
-            cell,
-            cell,
-        )
-        glow_surface = pygame.Surface((cell, cell), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.theme.snake_head, 90), (cell // 2, cell // 2), cell // 2)
-        surface.blit(glow_surface, glow_rect)
+        inner = pygame.Rect(0, 0, cell, cell).inflate(-cell * 0.25, -cell * 0.25)
+        colors = self.snake.segment_colors(self.theme.snake_body, self.theme.snake_head)
+        current = self.snake.seg_xy
+        previous = self.snake.previous_xy()
+        cells = previous + (current - previous) * self.move_progress
+        pixels = (np.array((offset_x, offset_y)) + cells * cell).astype(np.int64) + inner.topleft
+        blit_seq = [
+            (self._rounded_sprite(color, inner.size, 12), position)
+            for color, position in zip(colors, pixels.tolist())
+        ]
+        surface.blits(blit_seq, doreturn=False)
+        head = self.snake.head
+        glow_surface = self._glow_sprite((*self.theme.snake_head, 90), cell)
+        surface.blit(glow_surface, (offset_x + head[0] * cell, offset_y + head[1] * cell))
 
     def draw_food(self, surface: pygame.Surface) -> None:
         assert self.food
@@ -553,18 +745,19 @@ class SnakeGameApp:
             cell,
         )
         rect.inflate_ip(-cell * 0.35, -cell * 0.35)
-        pygame.draw.rect(surface, self.theme.food_primary, rect, border_radius=18)
+        surface.blit(self._rounded_sprite(self.theme.food_primary, rect.size, 18), rect)
         pulsate = (math.sin(pygame.time.get_ticks() / 220) + 1) / 2
-        glow_radius = int(rect.width * (1.15 + pulsate * 0.25))
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.theme.food_primary, 85), (glow_radius, glow_radius), glow_radius)
+        # Quantised to 8 pulse levels so the glow sprite cache stays tiny.
+        level = int(pulsate * 7.999)
+        glow_radius = int(rect.width * (1.15 + level / 7 * 0.25))
+        glow_surface = self._glow_sprite((*self.theme.food_primary, 85), glow_radius * 2)
         glow_rect = glow_surface.get_rect(center=rect.center)
         surface.blit(glow_surface, glow_rect)
 
     def draw_hud(self, surface: pygame.Surface) -> None:
-        score_surface = self.font_medium.render(f"Score: {self.score}", True, (245, 245, 245))
+        score_surface = self._render_text(self.font_medium, f"Score: {self.score}", (245, 245, 245))
         surface.blit(score_surface, (40, 40))
-        best_surface = self.font_small.render(f"Best: {self.high_score}", True, (225, 225, 230))
+        best_surface = self._render_text(self.font_small, f"Best: {self.high_score}", (225, 225, 230))
         surface.blit(best_surface, (44, 100))
 
     def draw_playing(self) -> None:
@@ -578,15 +771,15 @@ class SnakeGameApp:
 
     def draw_game_over(self) -> None:
         surface = self.window
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        overlay = self._overlay_surface(surface.get_size())
         overlay.fill((9, 9, 14, 160))
         surface.blit(overlay, (0, 0))
         self.draw_title(surface, "Game Over", surface.get_height() // 2 - 60)
-        score_text = self.font_medium.render(f"Score: {self.score}", True, (245, 245, 248))
+        score_text = self._render_text(self.font_medium, f"Score: {self.score}", (245, 245, 248))
         score_rect = score_text.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 + 20))
         surface.blit(score_text, score_rect)
         prompt_text = "Press ENTER to try again or ESC for menu"
-        prompt_surface = self.font_small.render(prompt_text, True, (235, 235, 240))
+        prompt_surface = self._render_text(self.font_small, prompt_text, (235, 235, 240))
         prompt_rect = prompt_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 + 90))
         surface.blit(prompt_surface, prompt_rect)
 
@@ -594,11 +787,21 @@ class SnakeGameApp:
     # Game loop
     # ------------------------------------------------------------------
 
+    def wait_for_events(self) -> List[pygame.event.Event]:
+        if self.state in self._idle_states and self.transition_alpha == 0:
+            # Nothing but the backdrop is moving, so let the OS sleep until input arrives.
+            first = pygame.event.wait(100)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+            return events
+        return pygame.event.get()
+
     def run(self) -> None:
         running = True
         while running:
-            dt = self.clock.tick(120) / 1000.0
-            events = pygame.event.get()
+            dt = self.clock.tick(self._target_fps if self.state == "playing" else 30) / 1000.0
+            events = self.wait_for_events()
             running = self.handle_events(events)
             self.update(dt)
             self.draw()